@@ -1,26 +1,23 @@
-from utils.file_handler import read_sales_data
-from utils.data_processor import (
-    parse_transactions,
-    validate_transactions,
-    calculate_total_revenue,
-    region_wise_sales,
-    top_selling_products,
-    customer_analysis,
-    daily_sales_trend,
-    find_peak_sales_day,
-    low_performing_products
-)
+import asyncio
+
+from utils.data_processor import validate_transactions
 from utils.api_handler import (
-    fetch_all_products,
     create_product_mapping,
     enrich_sales_data
 )
 from utils.report_generator import generate_sales_report
+from utils.pipeline import (
+    start_product_fetch,
+    collect_products,
+    ingest_transactions,
+    run_analysis
+)
+from utils.profiler import stage
 
 
-def main():
+async def run_pipeline():
     """
-    Main execution function
+    Runs all steps, fetching API products while local data is processed
     """
     try:
         print("=" * 40)
@@ -28,14 +25,16 @@ def main():
         print("=" * 40)
         print()
 
-        # 1️⃣ Read sales data
-        print("[1/10] Reading sales data...")
-        raw_data = read_sales_data("data/sales_data.txt")
-        print(f"✓ Successfully read {len(raw_data)} transactions\n")
+        # API fetch runs in the background until step 6 needs it
+        api_task = start_product_fetch()
 
+        # 1️⃣ Read sales data
         # 2️⃣ Parse and clean
+        print("[1/10] Reading sales data...")
         print("[2/10] Parsing and cleaning data...")
-        transactions = parse_transactions(raw_data)
+        with stage("ingest"):
+            line_count, transactions = await ingest_transactions("data/sales_data.txt")
+        print(f"✓ Successfully read {line_count} transactions")
         print(f"✓ Parsed {len(transactions)} records\n")
 
         # 3️⃣ Show filter options
@@ -61,29 +60,25 @@ def main():
 
         # 4️⃣ Validate transactions
         print("[4/10] Validating transactions...")
-        valid_txns, invalid_txns = validate_transactions(transactions)
+        with stage("validate"):
+            valid_txns, invalid_txns = validate_transactions(transactions)
         print(f"✓ Valid: {len(valid_txns)} | Invalid: {len(invalid_txns)}\n")
 
         # 5️⃣ Analysis
         print("[5/10] Analyzing sales data...")
-        calculate_total_revenue(valid_txns)
-        region_wise_sales(valid_txns)
-        top_selling_products(valid_txns)
-        customer_analysis(valid_txns)
-        daily_sales_trend(valid_txns)
-        find_peak_sales_day(valid_txns)
-        low_performing_products(valid_txns)
+        run_analysis(valid_txns)
         print("✓ Analysis complete\n")
 
         # 6️⃣ Fetch API data
         print("[6/10] Fetching product data from API...")
-        api_products = fetch_all_products()
+        api_products = await collect_products(api_task)
         print(f"✓ Fetched {len(api_products)} products\n")
 
         # 7️⃣ Enrich data
         print("[7/10] Enriching sales data...")
-        product_mapping = create_product_mapping(api_products)
-        enriched_txns = enrich_sales_data(valid_txns, product_mapping)
+        with stage("enrich"):
+            product_mapping = create_product_mapping(api_products)
+            enriched_txns = enrich_sales_data(valid_txns, product_mapping)
 
         enriched_count = sum(1 for t in enriched_txns if t.get("API_Match"))
         success_rate = (enriched_count / len(valid_txns)) * 100
@@ -95,7 +90,8 @@ def main():
 
         # 9️⃣ Generate report
         print("[9/10] Generating report...")
-        generate_sales_report(valid_txns, enriched_txns)
+        with stage("report"):
+            generate_sales_report(valid_txns, enriched_txns)
         print("✓ Report saved to: output/sales_report.txt\n")
 
         # 🔟 Done
@@ -107,5 +103,12 @@ def main():
         print(str(e))
 
 
+def main():
+    """
+    Main execution function
+    """
+    asyncio.run(run_pipeline())
+
+
 if __name__ == "__main__":
     main()
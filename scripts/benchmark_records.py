@@ -0,0 +1,119 @@
+"""
+Compares parsed dictionaries with Transaction records
+
+Checks that analytics and the sales report are identical for both
+representations, then measures memory per row and CPU time.
+
+Usage: python scripts/benchmark_records.py [rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.file_handler import read_sales_data
+from utils.data_processor import parse_transactions
+from utils.pipeline import run_analysis
+from utils.report_generator import generate_sales_report
+
+DATA_FILE = "data/sales_data.txt"
+
+
+def parse_plain(raw_lines):
+    """
+    Parses lines without sharing strings, as parsing did originally
+    """
+    transactions = []
+
+    for line in raw_lines:
+        parts = line.split("|")
+        if len(parts) != 8:
+            continue
+
+        txn_id, date, pid, pname, qty, price, cid, region = parts
+        try:
+            qty = int(qty.replace(",", ""))
+            price = float(price.replace(",", ""))
+        except ValueError:
+            continue
+
+        transactions.append({
+            "TransactionID": txn_id,
+            "Date": date,
+            "ProductID": pid,
+            "ProductName": pname.replace(",", " "),
+            "Quantity": qty,
+            "UnitPrice": price,
+            "CustomerID": cid,
+            "Region": region
+        })
+
+    return transactions
+
+
+def bytes_per_row(parse, raw_lines):
+    tracemalloc.start()
+    transactions = parse(raw_lines)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / len(transactions)
+
+
+def report_text(transactions, output_file):
+    generate_sales_report(transactions, transactions, output_file)
+    with open(output_file, encoding="utf-8") as f:
+        # Skip the timestamp line
+        return [line for line in f if "Generated:" not in line]
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    base_lines = read_sales_data(DATA_FILE)
+    raw_lines = (base_lines * (rows // len(base_lines) + 1))[:rows]
+
+    dicts = parse_transactions(raw_lines)
+    records = parse_transactions(raw_lines, as_records=True)
+
+    # ---------- EQUIVALENCE ----------
+    with tempfile.TemporaryDirectory() as tmp:
+        dict_report = report_text(dicts, os.path.join(tmp, "dicts.txt"))
+        record_report = report_text(records, os.path.join(tmp, "records.txt"))
+
+    if records != dicts:
+        sys.exit("FAIL: parsed records differ from dictionaries")
+    if run_analysis(records) != run_analysis(dicts):
+        sys.exit("FAIL: analysis results differ between dictionaries and records")
+    if record_report != dict_report:
+        sys.exit("FAIL: sales report differs between dictionaries and records")
+    print("OK: analysis and report identical for dictionaries and records")
+
+    # ---------- MEMORY ----------
+    print(f"\nMemory per row ({len(dicts)} rows):")
+    print(f"Plain dictionaries:   {bytes_per_row(parse_plain, raw_lines):>6.0f} bytes")
+    print(f"Encoded dictionaries: {bytes_per_row(parse_transactions, raw_lines):>6.0f} bytes")
+    print(f"Transaction records:  "
+          f"{bytes_per_row(lambda lines: parse_transactions(lines, as_records=True), raw_lines):>6.0f} bytes")
+
+    # ---------- CPU ----------
+    with tempfile.TemporaryDirectory() as tmp:
+        output_file = os.path.join(tmp, "report.txt")
+        print("\nCPU time:            dicts   records")
+        print(f"run_analysis:         {timed(run_analysis, dicts):>5.2f}s   "
+              f"{timed(run_analysis, records):>5.2f}s")
+        print(f"generate_sales_report:{timed(generate_sales_report, dicts, dicts, output_file):>5.2f}s   "
+              f"{timed(generate_sales_report, records, records, output_file):>5.2f}s")
+
+
+if __name__ == "__main__":
+    main()
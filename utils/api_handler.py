@@ -1,3 +1,8 @@
+import requests
+
+from utils.profiler import profiled
+
+
 def fetch_product_details(product_id):
     return {
         "product_id": product_id,
@@ -5,25 +10,43 @@ def fetch_product_details(product_id):
         "rating": 4.3
     }
 
-def fetch_all_products():
+def request_products():
     """
-    Fetches all products from DummyJSON API
+    Requests all products from DummyJSON API without printing
+
+    Raises: requests.RequestException on network or HTTP errors
     """
     url = "https://dummyjson.com/products?limit=100"
 
-    try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
+    response = requests.get(url, timeout=10)
+    response.raise_for_status()
 
-        data = response.json()
-        products = data.get("products", [])
+    data = response.json()
+    return data.get("products", [])
 
-        print("API fetch successful")
-        return products
+def report_product_fetch(products=None, error=None):
+    """
+    Prints the outcome of a product fetch
 
-    except Exception as e:
-        print("API fetch failed:", e)
+    Returns: list of products (empty if the fetch failed)
+    """
+    if error is not None:
+        print("API fetch failed:", error)
         return []
+
+    print("API fetch successful")
+    return products
+
+def fetch_all_products():
+    """
+    Fetches all products from DummyJSON API
+    """
+    try:
+        products = request_products()
+    except Exception as e:
+        return report_product_fetch(error=e)
+
+    return report_product_fetch(products)
         
 def create_product_mapping(api_products):
     """
@@ -47,7 +70,8 @@ def create_product_mapping(api_products):
             continue
 
     return product_mapping
-    def enrich_sales_data(transactions, product_mapping):
+@profiled()
+def enrich_sales_data(transactions, product_mapping):
     """
     Enriches transaction data with API product information
     """
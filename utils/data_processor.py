@@ -1,10 +1,121 @@
-def parse_transactions(raw_lines):
+from utils.profiler import profiled
+
+TRANSACTION_FIELDS = (
+    "TransactionID", "Date", "ProductID", "ProductName",
+    "Quantity", "UnitPrice", "CustomerID", "Region"
+)
+
+API_FIELDS = ("API_Category", "API_Brand", "API_Rating", "API_Match")
+
+# Hash lookup guard for Transaction item access
+_RECORD_FIELDS = frozenset(TRANSACTION_FIELDS + API_FIELDS)
+
+
+class Transaction:
+    """
+    Compact transaction record usable in place of a parsed dictionary
+
+    Supports the dictionary access used across the project
+    (txn["Key"], txn.get, txn.copy and item assignment of API fields).
+    Item access runs in Python, so loops over records cost roughly
+    2-3x the CPU time of the same loops over dicts.
+    """
+
+    __slots__ = TRANSACTION_FIELDS + API_FIELDS
+
+    def __init__(self, TransactionID, Date, ProductID, ProductName,
+                 Quantity, UnitPrice, CustomerID, Region):
+        self.TransactionID = TransactionID
+        self.Date = Date
+        self.ProductID = ProductID
+        self.ProductName = ProductName
+        self.Quantity = Quantity
+        self.UnitPrice = UnitPrice
+        self.CustomerID = CustomerID
+        self.Region = Region
+
+    def __getitem__(self, key):
+        if key not in _RECORD_FIELDS:
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        if key not in _RECORD_FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in _RECORD_FIELDS and hasattr(self, key)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __eq__(self, other):
+        if isinstance(other, (Transaction, dict)):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Transaction({self.to_dict()!r})"
+
+    def get(self, key, default=None):
+        return getattr(self, key, default) if key in _RECORD_FIELDS else default
+
+    def keys(self):
+        return [key for key in self.__slots__ if hasattr(self, key)]
+
+    def items(self):
+        return [(key, getattr(self, key)) for key in self.keys()]
+
+    def copy(self):
+        txn = Transaction.__new__(Transaction)
+        for key, value in self.items():
+            setattr(txn, key, value)
+        return txn
+
+    def to_dict(self):
+        return dict(self.items())
+
+
+def _clean_product_name(pname, product_names, string_pool):
+    cleaned = product_names.get(pname)
+    if cleaned is None:
+        # Clean product name (keep text, remove commas)
+        cleaned = pname.replace(",", " ")
+        cleaned = string_pool.setdefault(cleaned, cleaned)
+        product_names[pname] = cleaned
+    return cleaned
+
+
+@profiled()
+def parse_transactions(raw_lines, as_records=False, product_names=None, string_pool=None):
     """
     Parses raw lines into clean list of dictionaries
+
+    Repeated strings (dates, product, customer and region values) are
+    dictionary-encoded through string_pool so every transaction shares
+    one copy of each. With as_records=True, Transaction objects are
+    returned instead of dicts.
+
+    product_names caches raw -> cleaned product names. Pass the same
+    product_names and string_pool dicts to share them across batches;
+    by default both live for this call only.
     """
 
     transactions = []
 
+    if product_names is None:
+        product_names = {}
+    if string_pool is None:
+        string_pool = {}
+    encode = string_pool.setdefault
+
     for line in raw_lines:
         parts = line.split("|")
 
@@ -13,8 +124,7 @@ def parse_transactions(raw_lines):
 
         txn_id, date, pid, pname, qty, price, cid, region = parts
 
-        # Clean product name (keep text, remove commas)
-        pname = pname.replace(",", " ")
+        pname = _clean_product_name(pname, product_names, string_pool)
 
         try:
             qty = int(qty.replace(",", ""))
@@ -22,6 +132,17 @@ def parse_transactions(raw_lines):
         except ValueError:
             continue
 
+        date = encode(date, date)
+        pid = encode(pid, pid)
+        cid = encode(cid, cid)
+        region = encode(region, region)
+
+        if as_records:
+            transactions.append(
+                Transaction(txn_id, date, pid, pname, qty, price, cid, region)
+            )
+            continue
+
         transactions.append({
             "TransactionID": txn_id,
             "Date": date,
@@ -34,6 +155,41 @@ def parse_transactions(raw_lines):
         })
 
     return transactions
+
+
+def _is_valid_transaction(txn):
+    return (
+        txn["TransactionID"].startswith("T")
+        and txn["ProductID"].startswith("P")
+        and txn["CustomerID"].startswith("C")
+        and txn["Quantity"] > 0
+        and txn["UnitPrice"] > 0
+    )
+
+
+@profiled()
+def validate_transactions(transactions):
+    """
+    Splits transactions into valid and invalid lists
+
+    Returns: (valid_transactions, invalid_transactions)
+    """
+    valid_transactions = []
+    invalid_transactions = []
+
+    for txn in transactions:
+        try:
+            if _is_valid_transaction(txn):
+                valid_transactions.append(txn)
+            else:
+                invalid_transactions.append(txn)
+        except KeyError:
+            invalid_transactions.append(txn)
+
+    return valid_transactions, invalid_transactions
+
+
+@profiled()
 def validate_and_filter(transactions, region=None, min_amount=None, max_amount=None):
     valid_transactions = []
     invalid_count = 0
@@ -43,13 +199,7 @@ def validate_and_filter(transactions, region=None, min_amount=None, max_amount=N
 
     for txn in transactions:
         try:
-            if (
-                not txn["TransactionID"].startswith("T")
-                or not txn["ProductID"].startswith("P")
-                or not txn["CustomerID"].startswith("C")
-                or txn["Quantity"] <= 0
-                or txn["UnitPrice"] <= 0
-            ):
+            if not _is_valid_transaction(txn):
                 invalid_count += 1
                 continue
 
@@ -93,6 +243,7 @@ def validate_and_filter(transactions, region=None, min_amount=None, max_amount=N
 
     return filtered, invalid_count, summary
     
+@profiled()
 def calculate_total_revenue(transactions):
     """
     Calculates total revenue from all transactions
@@ -102,6 +253,7 @@ def calculate_total_revenue(transactions):
         total_revenue += txn["Quantity"] * txn["UnitPrice"]
     return round(total_revenue, 2)
     
+@profiled()
 def region_wise_sales(transactions):
     region_data = {}
     total_sales = 0.0
@@ -134,6 +286,7 @@ def region_wise_sales(transactions):
     )
 
     return sorted_regions
+@profiled()
 def top_selling_products(transactions, n=5):
     product_data = {}
 
@@ -159,6 +312,7 @@ def top_selling_products(transactions, n=5):
     result.sort(key=lambda x: x[1], reverse=True)
 
     return result[:n]
+@profiled()
 def customer_analysis(transactions):
     customer_data = {}
 
@@ -200,6 +354,7 @@ def customer_analysis(transactions):
     )
 
     return sorted_customers
+@profiled()
 def daily_sales_trend(transactions):
     daily_data = {}
 
@@ -229,6 +384,7 @@ def daily_sales_trend(transactions):
         }
 
     return result
+@profiled()
 def find_peak_sales_day(transactions):
     daily = daily_sales_trend(transactions)
 
@@ -243,6 +399,7 @@ def find_peak_sales_day(transactions):
             peak_date = date
 
     return (peak_date, max_revenue, txn_count)
+@profiled()
 def low_performing_products(transactions, threshold=10):
     product_data = {}
 
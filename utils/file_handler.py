@@ -1,31 +1,85 @@
-def read_sales_data(filename):
-    """
-    Reads sales data from file handling encoding issues
+ENCODINGS = ["utf-8", "latin-1", "cp1252"]
 
-    Returns: list of raw lines (strings)
+
+def _detect_encoding(filename, chunk_size=65536):
     """
+    Finds the first supported encoding that decodes the whole file
+
+    The file is scanned in chunks, so it is never held in memory.
 
-    encodings = ["utf-8", "latin-1", "cp1252"]
+    Returns: encoding name, or None if the file cannot be read
+    """
 
-    for enc in encodings:
+    for enc in ENCODINGS:
         try:
             with open(filename, "r", encoding=enc) as file:
-                lines = file.readlines()
-                break
+                while file.read(chunk_size):
+                    pass
+            return enc
         except UnicodeDecodeError:
             continue
         except FileNotFoundError:
             print(f"Error: File '{filename}' not found.")
-            return []
-    else:
-        print("Error: Unable to read file with supported encodings.")
+            return None
+
+    print("Error: Unable to read file with supported encodings.")
+    return None
+
+
+def _clean_line(line):
+    line = line.strip()
+    if not line or line.startswith("TransactionID"):
+        return None
+    return line
+
+
+def read_sales_data(filename):
+    """
+    Reads sales data from file handling encoding issues
+
+    Returns: list of raw lines (strings)
+    """
+
+    encoding = _detect_encoding(filename)
+    if encoding is None:
         return []
 
     cleaned_lines = []
-    for line in lines:
-        line = line.strip()
-        if not line or line.startswith("TransactionID"):
-            continue
-        cleaned_lines.append(line)
+    with open(filename, "r", encoding=encoding) as file:
+        for line in file:
+            line = _clean_line(line)
+            if line is not None:
+                cleaned_lines.append(line)
 
     return cleaned_lines
+
+
+def read_sales_data_batches(filename, batch_size=500):
+    """
+    Streams sales data from file in batches of cleaned lines
+
+    The encoding is chosen once for the whole file, as in
+    read_sales_data, and lines are then read without loading the
+    file in full.
+
+    Yields: lists of raw lines (strings)
+    """
+
+    encoding = _detect_encoding(filename)
+    if encoding is None:
+        return
+
+    with open(filename, "r", encoding=encoding) as file:
+        batch = []
+        for line in file:
+            line = _clean_line(line)
+            if line is None:
+                continue
+
+            batch.append(line)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
@@ -0,0 +1,125 @@
+import asyncio
+
+from utils.file_handler import read_sales_data_batches
+from utils.data_processor import (
+    parse_transactions,
+    calculate_total_revenue,
+    region_wise_sales,
+    top_selling_products,
+    customer_analysis,
+    daily_sales_trend,
+    find_peak_sales_day,
+    low_performing_products
+)
+from utils.api_handler import request_products, report_product_fetch
+from utils.profiler import profiled
+
+# Marks the end of a stream on a stage queue
+_DONE = None
+
+
+def start_product_fetch():
+    """
+    Starts fetching API products in a background thread
+
+    The request runs quietly so it cannot print over user prompts;
+    its outcome is reported by collect_products.
+
+    Returns: asyncio task resolving to the product list
+    """
+    return asyncio.create_task(asyncio.to_thread(request_products))
+
+
+async def collect_products(api_task):
+    """
+    Waits for the background product fetch and reports its outcome
+
+    Returns: list of products (empty if the fetch failed)
+    """
+    try:
+        products = await api_task
+    except Exception as e:
+        return report_product_fetch(error=e)
+
+    return report_product_fetch(products)
+
+
+async def _read_stage(filename, batch_size, out_queue, stats):
+    batches = read_sales_data_batches(filename, batch_size)
+
+    while True:
+        batch = await asyncio.to_thread(next, batches, _DONE)
+        if batch is _DONE:
+            break
+
+        stats["lines_read"] += len(batch)
+        await out_queue.put(batch)
+
+    await out_queue.put(_DONE)
+
+
+async def _parse_stage(in_queue, out_queue, as_records):
+    # Shared across batches and freed once ingestion finishes
+    product_names = {}
+    string_pool = {}
+
+    while True:
+        batch = await in_queue.get()
+        if batch is _DONE:
+            break
+
+        await out_queue.put(parse_transactions(batch, as_records, product_names, string_pool))
+
+    await out_queue.put(_DONE)
+
+
+async def _collect_stage(in_queue, transactions):
+    while True:
+        batch = await in_queue.get()
+        if batch is _DONE:
+            break
+
+        transactions.extend(batch)
+
+
+async def ingest_transactions(filename, batch_size=500, queue_size=4, as_records=False):
+    """
+    Reads and parses sales data as a stream of batches
+
+    Stages are connected by bounded queues, so the reader blocks
+    once queue_size batches are waiting to be parsed. With
+    as_records=True, Transaction objects are collected instead of dicts.
+
+    Returns: (number of raw lines read, list of parsed transactions)
+    """
+    raw_queue = asyncio.Queue(maxsize=queue_size)
+    parsed_queue = asyncio.Queue(maxsize=queue_size)
+    stats = {"lines_read": 0}
+    transactions = []
+
+    await asyncio.gather(
+        _read_stage(filename, batch_size, raw_queue, stats),
+        _parse_stage(raw_queue, parsed_queue, as_records),
+        _collect_stage(parsed_queue, transactions)
+    )
+
+    return stats["lines_read"], transactions
+
+
+@profiled("analysis")
+def run_analysis(transactions):
+    """
+    Runs all sales analytics
+
+    Returns: dictionary of analysis results
+    """
+    return {
+        "total_revenue": calculate_total_revenue(transactions),
+        "region_sales": region_wise_sales(transactions),
+        "top_products": top_selling_products(transactions),
+        "customers": customer_analysis(transactions),
+        "daily_trend": daily_sales_trend(transactions),
+        "peak_day": find_peak_sales_day(transactions),
+        "low_products": low_performing_products(transactions)
+    }
+
@@ -0,0 +1,264 @@
+import atexit
+import concurrent.futures.thread
+import cProfile
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from contextlib import nullcontext
+from functools import wraps
+
+# Profiling is switched on with SALES_PROFILE=1 and decided once at import,
+# so disabled runs keep the original, unwrapped functions.
+PROFILE_ENABLED = os.environ.get("SALES_PROFILE", "") not in ("", "0")
+PROFILE_DIR = os.environ.get("SALES_PROFILE_DIR", "output/profile")
+DEFAULT_TOP_N = 10
+SAMPLE_INTERVAL = 0.005
+
+# Thread start-up and profiler frames are left out of sampled stacks
+_SKIPPED_FILES = frozenset((
+    threading.__file__,
+    concurrent.futures.thread.__file__,
+    tracemalloc.__file__,
+    __file__
+))
+
+# Allocation reports only cover this project's code; other threads
+# (such as the background API fetch) allocate in stdlib/site-packages
+_PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+_project_files = {}                      # filename -> bool, filled lazily
+
+_NO_STAGE = nullcontext()
+
+_lock = threading.Lock()
+_active_stages = {}                      # thread id -> tuple of stage names
+_profiles = {}                           # stage -> cProfile.Profile
+_running_profiles = set()                # stages with cProfile running
+_thread_profiles = {}                    # thread id -> enabled cProfile.Profile
+_function_ranges = []                    # (filename, first, last line, stage)
+_allocations = defaultdict(Counter)      # stage -> {site: bytes}
+_stacks = Counter()                      # collapsed stack -> samples
+_sampler = None
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    filename = os.path.basename(code.co_filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+def _sample_loop():
+    own_id = threading.get_ident()
+
+    while True:
+        time.sleep(SAMPLE_INTERVAL)
+        frames = sys._current_frames()
+
+        for thread_id, stages in list(_active_stages.items()):
+            frame = frames.get(thread_id)
+            if thread_id == own_id or frame is None:
+                continue
+
+            labels = []
+            while frame is not None:
+                if frame.f_code.co_filename not in _SKIPPED_FILES:
+                    labels.append(_frame_label(frame))
+                frame = frame.f_back
+            labels.append(stages[0])
+            labels.reverse()
+
+            _stacks[";".join(labels)] += 1
+
+
+def _start_sampler():
+    global _sampler
+
+    with _lock:
+        if _sampler is not None:
+            return
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+        _sampler = threading.Thread(target=_sample_loop, daemon=True)
+        _sampler.start()
+        atexit.register(write_report)
+
+
+def _top_n():
+    try:
+        return int(os.environ.get("SALES_PROFILE_TOP", DEFAULT_TOP_N))
+    except ValueError:
+        return DEFAULT_TOP_N
+
+
+def _is_project_file(filename):
+    result = _project_files.get(filename)
+    if result is None:
+        result = (
+            filename.startswith(_PROJECT_DIR)
+            and "site-packages" not in filename
+            and filename != __file__
+        )
+        _project_files[filename] = result
+    return result
+
+
+def _register_function(func, stage_name):
+    code = func.__code__
+    lines = [line for _, _, line in code.co_lines() if line is not None]
+    _function_ranges.append(
+        (code.co_filename, code.co_firstlineno, max(lines, default=code.co_firstlineno), stage_name)
+    )
+
+
+def _site_stage(filename, lineno, default):
+    for range_file, first, last, stage_name in _function_ranges:
+        if filename == range_file and first <= lineno <= last:
+            return stage_name
+    return default
+
+
+class _Stage:
+    """
+    Records cProfile stats, stack samples and allocations for one stage
+
+    A nested stage pauses the enclosing stage's profiler, so each .prof
+    file holds only the time spent in that stage itself. Allocations are
+    traced from the outermost stage and each site is credited to the
+    profiled function whose body contains it.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        _start_sampler()
+
+        self.thread_id = threading.get_ident()
+        self.outer = _active_stages.get(self.thread_id, ())
+        _active_stages[self.thread_id] = self.outer + (self.name,)
+
+        # One cProfile profiler can run per thread, so the enclosing
+        # one is paused while this stage runs
+        self.parent_profile = _thread_profiles.get(self.thread_id)
+        self.profile = None
+        with _lock:
+            if self.name not in _running_profiles:
+                if self.name not in _profiles:
+                    _profiles[self.name] = cProfile.Profile()
+                self.profile = _profiles[self.name]
+                _running_profiles.add(self.name)
+
+        # Starting from empty traces keeps the exit snapshot limited to
+        # this stage; skipped while another thread is inside a stage
+        self.track_allocations = not self.outer and len(_active_stages) == 1
+        if self.track_allocations:
+            tracemalloc.clear_traces()
+
+        if self.profile is not None:
+            if self.parent_profile is not None:
+                self.parent_profile.disable()
+            _thread_profiles[self.thread_id] = self.profile
+            self.profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.profile is not None:
+            self.profile.disable()
+            with _lock:
+                _running_profiles.discard(self.name)
+
+            if self.parent_profile is not None:
+                _thread_profiles[self.thread_id] = self.parent_profile
+                self.parent_profile.enable()
+            else:
+                _thread_profiles.pop(self.thread_id, None)
+
+        if self.track_allocations:
+            for stat in tracemalloc.take_snapshot().statistics("lineno"):
+                frame = stat.traceback[0]
+                if not _is_project_file(frame.filename):
+                    continue
+                stage_name = _site_stage(frame.filename, frame.lineno, self.name)
+                _allocations[stage_name][f"{frame.filename}:{frame.lineno}"] += stat.size
+
+        if self.outer:
+            _active_stages[self.thread_id] = self.outer
+        else:
+            _active_stages.pop(self.thread_id, None)
+        return False
+
+
+def stage(name):
+    """
+    Context manager that profiles a pipeline stage when profiling is enabled
+    """
+    if not PROFILE_ENABLED:
+        return _NO_STAGE
+    return _Stage(name)
+
+
+def profiled(name=None):
+    """
+    Decorator that profiles every call of a function as a stage
+
+    Returns the function unchanged when profiling is disabled.
+    """
+    def decorator(func):
+        if not PROFILE_ENABLED:
+            return func
+
+        stage_name = name or func.__name__
+        _register_function(func, stage_name)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with _Stage(stage_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def write_report(output_dir=None):
+    """
+    Writes collected profiling data
+
+    Files written to output_dir (SALES_PROFILE_DIR by default):
+    stacks.collapsed   - collapsed stacks for flamegraph.pl / speedscope
+    <stage>.prof       - cProfile stats, readable with pstats
+    allocations.txt    - top allocation sites in project code per stage
+                         (SALES_PROFILE_TOP sites, 10 by default)
+    """
+    if not PROFILE_ENABLED:
+        return
+
+    output_dir = output_dir or PROFILE_DIR
+    top_n = _top_n()
+
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+
+        with open(os.path.join(output_dir, "stacks.collapsed"), "w", encoding="utf-8") as f:
+            for stack, count in sorted(dict(_stacks).items()):
+                f.write(f"{stack} {count}\n")
+
+        for name, profile in dict(_profiles).items():
+            profile.dump_stats(os.path.join(output_dir, f"{name}.prof"))
+
+        with open(os.path.join(output_dir, "allocations.txt"), "w", encoding="utf-8") as f:
+            for name, sites in dict(_allocations).items():
+                f.write(f"{name}\n")
+                f.write("-" * 50 + "\n")
+                for site, size in Counter(dict(sites)).most_common(top_n):
+                    f.write(f"{size / 1024:>10.1f} KiB  {site}\n")
+                f.write("\n")
+
+        print(f"Profiling data saved to: {output_dir}")
+
+    except Exception as e:
+        print("Failed to save profiling data:", e)
@@ -1,5 +1,10 @@
 from datetime import datetime
 from collections import defaultdict
+
+from utils.profiler import profiled
+
+
+@profiled()
 def generate_sales_report(transactions, enriched_transactions, output_file="output/sales_report.txt"):
     """
     Generates a comprehensive formatted text report